@@ -6,12 +6,120 @@ for staff review.
 """
 
 from agents.realtime import RealtimeAgent, RealtimeRunner
-from translator import TranslationService
+from translator import TranslationService, get_translation_service, load_language_detector
+from translation_cache import DEFAULT_CACHE_FILE, open_cache
 
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import json
 import asyncio
-from typing import Optional, Tuple, Dict, Any
+import io
+import logging
+import queue
+import sqlite3
+import sys
+import time
+from typing import Optional, Tuple, Dict, Any, Iterable, List, Union
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder, see the "fast" extra
+    orjson = None
+
+try:
+    from aiofile import async_open
+except ImportError:  # optional kernel async file I/O, see the "fast" extra
+    async_open = None
+
+
+log = logging.getLogger(__name__)
+
+# Speakers whose messages are translated; SYSTEM lines are always English
+TRANSLATED_SPEAKERS = frozenset({"USER", "RECEPTIONIST"})
+
+
+def _configure_logging():
+    """Send this module's log records to stdout from a background thread.
+
+    Records are put on a queue by a QueueHandler and written by a
+    QueueListener thread, so the realtime event loop never blocks on console
+    I/O. Does nothing if handlers are already attached.
+    """
+    if log.handlers:
+        return
+
+    records = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(records, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    log.addHandler(QueueHandler(records))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def _isoformat(timestamp: float) -> str:
+    """Format an epoch timestamp as a local ISO 8601 string.
+
+    Args:
+        timestamp: Seconds since the epoch.
+
+    Returns:
+        ISO 8601 string with second precision.
+    """
+    return datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")
+
+
+def _translation_tuple(result: Dict[str, Any]) -> Tuple[str, str, bool]:
+    """Convert a translator result dictionary to an immutable field tuple.
+
+    Args:
+        result: Result dictionary from the translation service.
+
+    Returns:
+        Tuple of (translated, source_language, needs_translation).
+    """
+    return result["translated"], result["source_language"], result["needs_translation"]
+
+
+def _write_data(path: str, data: Union[str, bytes]):
+    """Replace a file's contents with a single write.
+
+    Args:
+        path: File to write.
+        data: Text, written as UTF-8, or bytes.
+    """
+    if isinstance(data, bytes):
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+
+
+async def _write_file(path: str, data: Union[str, bytes]):
+    """Replace a file's contents without blocking the event loop.
+
+    The data is written with one call, through aiofile when it is installed
+    and on a worker thread otherwise.
+
+    Args:
+        path: File to write.
+        data: Text, written as UTF-8, or bytes.
+    """
+    if async_open is None:
+        await asyncio.to_thread(_write_data, path, data)
+        return
+
+    if isinstance(data, bytes):
+        async with async_open(path, "wb") as afp:
+            await afp.write(data)
+    else:
+        async with async_open(path, "w", encoding="utf-8") as afp:
+            await afp.write(data)
 
 
 class TranscriptLogger:
@@ -24,12 +132,35 @@ class TranscriptLogger:
     Attributes:
         filename: Path to the main transcript file.
         base_filename: Filename without extension for generating related files.
-        transcript: List of transcript entries with metadata.
+        timestamps: Timestamp of each transcript entry, in seconds since the
+            epoch; formatted only when written out.
+        speakers: Speaker of each entry, parallel to timestamps.
+        messages: Message text of each entry, parallel to timestamps.
+        translations: Per-entry (translated, source_language, needs_translation)
+            tuple, or None while the entry is untranslated.
         enable_translation: Whether translation is enabled.
         translator: TranslationService instance if translation is enabled.
+        flush_every: Number of entries after which the transcript file is
+            flushed.
+        flush_interval: Seconds after which buffered entries are flushed.
+
+    The main transcript file is kept open for the lifetime of the logger and
+    entries are appended through a 64 KiB buffer that is flushed every
+    flush_every entries or flush_interval seconds; call close() when the
+    session ends. Inside an event loop, await start() to move the file writes
+    to a background writer task and await stop() before saving. Entries to
+    translate are collected while the conversation runs and translated with a
+    single batched request when a transcript is saved.
     """
 
-    def __init__(self, filename: Optional[str] = None, enable_translation: bool = True):
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        enable_translation: bool = True,
+        flush_every: int = 20,
+        flush_interval: float = 5.0,
+        cache_file: Optional[str] = DEFAULT_CACHE_FILE,
+    ):
         """Initialize the transcript logger.
 
         Args:
@@ -37,15 +168,43 @@ class TranscriptLogger:
                 filename automatically.
             enable_translation: Whether to enable automatic translation to English.
                 Defaults to True.
+            flush_every: Flush the transcript file after this many entries.
+                Defaults to 20.
+            flush_interval: Flush the transcript file when this many seconds
+                have passed since the last flush. Defaults to 5.0.
+            cache_file: SQLite file that keeps translations across sessions,
+                or None to disable the persistent cache.
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"hotel_conversation_{timestamp}.txt"
         self.filename = filename
         self.base_filename = filename.rsplit(".", 1)[0]
-        self.transcript = []
+        self.timestamps: List[float] = []
+        self.speakers: List[str] = []
+        self.messages: List[str] = []
+        self.translations: List[Optional[Tuple[str, str, bool]]] = []
         self.enable_translation = enable_translation
         self.translator = self._initialize_translator()
+        # Repeated phrases ("yes", "thank you") are translated only once
+        self._translation_cache: Dict[str, Tuple[str, str, bool]] = {}
+        self._disk_cache = open_cache(cache_file) if self.enable_translation else None
+        self._pending_translations: List[int] = []
+        # Concurrent saves must not resolve the same pending entries twice
+        self._translation_lock = asyncio.Lock()
+        self._detector_loader: Optional[asyncio.Task] = None
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        # The logger owns the file for the session, so start it empty. Append
+        # mode then keeps direct writes after the lines the writer task added
+        open(self.filename, "w").close()
+        self._fh = open(self.filename, "a", encoding="utf-8", buffering=64 * 1024)
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        # Same lines as the transcript file, kept in memory for transcript_text()
+        self._text = io.StringIO()
 
     def _initialize_translator(self) -> Optional[TranslationService]:
         """Initialize the translation service if enabled.
@@ -57,7 +216,7 @@ class TranscriptLogger:
             return None
 
         try:
-            translator = TranslationService()
+            translator = get_translation_service()
             print("Translation service enabled")
             return translator
         except Exception as e:
@@ -79,102 +238,377 @@ class TranscriptLogger:
             message: The message text.
             timestamp: Message timestamp. If None, uses current time.
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        index = len(self.messages)
+        self.timestamps.append(
+            time.time() if timestamp is None else timestamp.timestamp()
+        )
+        self.speakers.append(speaker)
+        self.messages.append(message)
+        self.translations.append(None)
+        self._add_translation_to_entry(index, speaker, message)
+        self._write_entry_to_file(index)
+
+    def add_entries(
+        self, rows: Iterable[Tuple[str, ...]], timestamp: Optional[datetime] = None
+    ):
+        """Add several conversation entries at once.
 
-        entry = self._create_entry(speaker, message, timestamp)
-        entry = self._add_translation_to_entry(entry, speaker, message)
-        self.transcript.append(entry)
-        self._write_entry_to_file(entry, timestamp)
+        All entries share one timestamp and their transcript lines are
+        written with a single call; otherwise this behaves like calling
+        add_entry() for each row.
 
-    def _create_entry(
-        self, speaker: str, message: str, timestamp: datetime
-    ) -> Dict[str, Any]:
-        """Create a basic transcript entry dictionary.
+        Args:
+            rows: (speaker, message) tuples in conversation order. Any fields
+                after the message are ignored.
+            timestamp: Timestamp for every entry. If None, uses current time.
+        """
+        # Unpack every row before touching the columns so a malformed row
+        # cannot leave them with different lengths
+        entries = [(speaker, message) for speaker, message, *_ in rows]
+        count = len(entries)
+        if count == 0:
+            return
+
+        start = len(self.messages)
+        self.speakers.extend(speaker for speaker, _ in entries)
+        self.messages.extend(message for _, message in entries)
+        ts = time.time() if timestamp is None else timestamp.timestamp()
+        self.timestamps.extend([ts] * count)
+        self.translations.extend([None] * count)
+        for index in range(start, start + count):
+            self._add_translation_to_entry(
+                index, self.speakers[index], self.messages[index]
+            )
+        lines = "".join(self._format_line(index) for index in range(start, start + count))
+        self._write_text(lines, count)
+
+    @property
+    def transcript(self) -> List[Dict[str, Any]]:
+        """Transcript entries as dictionaries, built on demand for export.
+
+        Returns:
+            List of entry dictionaries with timestamp, speaker, message and,
+            once translated, the translation fields.
+        """
+        return [self._create_entry(index) for index in range(len(self.messages))]
+
+    def _create_entry(self, index: int) -> Dict[str, Any]:
+        """Create a transcript entry dictionary from the stored columns.
 
         Args:
-            speaker: Speaker identifier.
-            message: The message text.
-            timestamp: Message timestamp.
+            index: Position of the entry in the transcript.
 
         Returns:
-            Dictionary with timestamp, speaker, and message.
+            Dictionary with timestamp, speaker, message and translation data
+            if available.
         """
-        return {
-            "timestamp": timestamp.isoformat(),
-            "speaker": speaker,
-            "message": message,
+        entry = {
+            "timestamp": _isoformat(self.timestamps[index]),
+            "speaker": self.speakers[index],
+            "message": self.messages[index],
         }
+        translation = self.translations[index]
+        if translation is not None:
+            translated, source_language, needs_translation = translation
+            entry["translated"] = translated
+            entry["source_language"] = source_language
+            entry["needs_translation"] = needs_translation
+        return entry
 
-    def _add_translation_to_entry(
-        self, entry: Dict[str, Any], speaker: str, message: str
-    ) -> Dict[str, Any]:
+    def _add_translation_to_entry(self, index: int, speaker: str, message: str):
         """Add translation data to a transcript entry if applicable.
 
+        Entries already in English (by the translator's local detection) are
+        stored untranslated right away. Others are only queued here so
+        logging never waits on the translation API; queued entries are
+        translated together when the transcript is next saved.
+
         Args:
-            entry: The transcript entry dictionary.
+            index: Position of the entry in the transcript.
             speaker: Speaker identifier.
             message: The message text.
+        """
+        if not self.enable_translation or speaker not in TRANSLATED_SPEAKERS:
+            return
+
+        # The local model is only consulted once start() has loaded it
+        if self.translator.known_language(message, load_detector=False) == "English":
+            self.translations[index] = (message, "English", False)
+            return
+
+        self._pending_translations.append(index)
+
+    async def _resolve_translations(self):
+        """Translate all queued entries with one batched translator call.
+
+        Messages not seen before in this session are looked up in the
+        persistent cache, and the rest are sent to the translator in a single
+        batch_translate() call; if that fails, the messages are translated
+        one by one, concurrently. New translations are written back to the
+        persistent cache. Blocking calls run on worker threads, and the lock
+        lets only one save resolve translations at a time.
+        """
+        async with self._translation_lock:
+            if not self._pending_translations:
+                return
+
+            indices = self._pending_translations
+            self._pending_translations = []
+            missing = [
+                message
+                for message in dict.fromkeys(self.messages[index] for index in indices)
+                if message not in self._translation_cache
+            ]
+            if missing and self._disk_cache is not None:
+                # A locked or damaged cache only costs API calls, never the save
+                try:
+                    cached = await asyncio.to_thread(self._disk_cache.get_many, missing)
+                except sqlite3.Error as e:
+                    print(f"Warning: Could not read translation cache: {e}")
+                    cached = {}
+                self._translation_cache.update(cached)
+                missing = [message for message in missing if message not in cached]
+
+            if missing:
+                fresh = await self._translate_messages(missing)
+                self._translation_cache.update(fresh)
+                if self._disk_cache is not None:
+                    # Failed detections come back as "Unknown"; retry those next time
+                    try:
+                        await asyncio.to_thread(
+                            self._disk_cache.put_many,
+                            {m: t for m, t in fresh.items() if t[1] != "Unknown"},
+                        )
+                    except sqlite3.Error as e:
+                        print(f"Warning: Could not update translation cache: {e}")
+
+            for index in indices:
+                self.translations[index] = self._translation_cache[self.messages[index]]
+
+    async def _translate_messages(
+        self, messages: List[str]
+    ) -> Dict[str, Tuple[str, str, bool]]:
+        """Translate messages in one batch, or concurrently one by one on failure.
+
+        Args:
+            messages: Distinct message texts to translate.
 
         Returns:
-            Updated entry dictionary with translation data if applicable.
+            Dictionary mapping each message to its translation fields.
         """
-        if not self.enable_translation or speaker not in ["USER", "RECEPTIONIST"]:
-            return entry
+        try:
+            # The translator's own fallback is sequential; run ours concurrently
+            results = await asyncio.to_thread(
+                self.translator.batch_translate, messages, fallback=False
+            )
+            return {
+                message: _translation_tuple(result)
+                for message, result in zip(messages, results, strict=True)
+            }
+        except Exception as e:
+            print(f"Batch translation error: {e}")
 
+        fields = await asyncio.gather(
+            *(asyncio.to_thread(self._translation_fields, message) for message in messages)
+        )
+        return dict(zip(messages, fields))
+
+    def _translation_fields(self, message: str) -> Tuple[str, str, bool]:
+        """Translate a single message, falling back on errors.
+
+        Args:
+            message: The message text.
+
+        Returns:
+            Tuple of (translated, source_language, needs_translation).
+        """
         try:
-            translation_result = self.translator.translate_to_english(message)
-            entry["translated"] = translation_result["translated"]
-            entry["source_language"] = translation_result["source_language"]
-            entry["needs_translation"] = translation_result["needs_translation"]
+            return _translation_tuple(self.translator.translate_to_english(message))
         except Exception as e:
             print(f"Translation error for entry: {e}")
-            entry["translated"] = message
-            entry["source_language"] = "Unknown"
-            entry["needs_translation"] = False
+            return message, "Unknown", False
 
-        return entry
+    def _write_entry_to_file(self, index: int):
+        """Append a transcript entry to the transcript file.
+
+        Args:
+            index: Position of the entry in the transcript.
+        """
+        self._write_text(self._format_line(index), 1)
 
-    def _write_entry_to_file(self, entry: Dict[str, Any], timestamp: datetime):
-        """Write a transcript entry to file immediately.
+    def _format_line(self, index: int) -> str:
+        """Format an entry as a "[HH:MM:SS] SPEAKER: message" transcript line.
 
         Args:
-            entry: The transcript entry dictionary.
-            timestamp: Message timestamp for formatting.
+            index: Position of the entry in the transcript.
+
+        Returns:
+            Newline-terminated transcript line.
+        """
+        return (
+            f"[{self._clock_time(self.timestamps[index])}] "
+            f"{self.speakers[index]}: {self.messages[index]}\n"
+        )
+
+    def _write_text(self, text: str, count: int):
+        """Record transcript lines and hand them to the file writer.
+
+        The text is handed to the background writer when it is running and
+        written directly otherwise.
+
+        Args:
+            text: One or more newline-terminated transcript lines.
+            count: Number of lines in text.
+        """
+        self._text.write(text)
+        if self._writer is not None:
+            self._queue.put_nowait(text)
+        else:
+            self._write_lines(text, count)
+
+    def _write_lines(self, text: str, count: int):
+        """Write transcript lines and flush when the flush policy is due.
+
+        Args:
+            text: One or more newline-terminated transcript lines.
+            count: Number of lines in text.
+        """
+        self._fh.write(text)
+        self._unflushed += count
+        if (
+            self._unflushed >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush()
+
+    async def start(self):
+        """Start the background writer so file I/O stays off the event loop.
+
+        With translation enabled, the local language model is also loaded on
+        a worker thread so that language checks in add_entry() never wait
+        for it.
+        """
+        if self.enable_translation and self._detector_loader is None:
+            self._detector_loader = asyncio.create_task(
+                asyncio.to_thread(load_language_detector)
+            )
+        if self._writer is None:
+            self._flush()
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.create_task(self._writer_task())
+
+    async def stop(self):
+        """Write all queued lines and stop the background writer."""
+        if self._writer is not None:
+            self._queue.put_nowait(None)
+            await self._writer
+            self._writer = None
+        if self._detector_loader is not None:
+            try:
+                await self._detector_loader
+            except Exception as e:
+                log.warning("Could not load the local language detector: %s", e)
+            self._detector_loader = None
+
+    async def _writer_task(self):
+        """Write queued lines through aiofile, or a worker thread without it.
+
+        aiofile submits writes through the kernel's asynchronous I/O interface
+        (caio) instead of occupying a thread per write.
         """
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(
-                f"[{timestamp.strftime('%H:%M:%S')}] {entry['speaker']}: {entry['message']}\n"
+        if async_open is None:
+            await self._drain_queue(
+                lambda text, count: asyncio.to_thread(self._write_lines, text, count)
             )
+            return
 
-    def save_full_transcript(self) -> Tuple[str, Optional[str]]:
+        async with async_open(self.filename, "a", encoding="utf-8") as afp:
+            await self._drain_queue(lambda text, count: afp.write(text))
+
+    async def _drain_queue(self, write):
+        """Drain queued lines and write each batch with a single call.
+
+        Args:
+            write: Coroutine function taking (text, line_count).
+        """
+        while True:
+            lines = [await self._queue.get()]
+            while not self._queue.empty():
+                lines.append(self._queue.get_nowait())
+
+            done = lines[-1] is None
+            if done:
+                lines.pop()
+            if lines:
+                await write("".join(lines), len(lines))
+            if done:
+                return
+
+    def _flush(self):
+        """Flush buffered transcript lines to disk (without fsync)."""
+        if not self._fh.closed:
+            self._fh.flush()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def transcript_text(self) -> str:
+        """Get the plain-text transcript accumulated so far.
+
+        The entry lines only carry clock times, so the text starts with a
+        session date header that downstream extraction can resolve relative
+        dates ("tonight", "tomorrow") against.
+
+        Returns:
+            "Session date: YYYY-MM-DD" header followed by one
+            "[HH:MM:SS] SPEAKER: message" line per entry.
+        """
+        started = self.timestamps[0] if self.timestamps else time.time()
+        session_date = datetime.fromtimestamp(started).date().isoformat()
+        return f"Session date: {session_date}\n" + self._text.getvalue()
+
+    def _clock_time(self, timestamp: float) -> str:
+        """Format a timestamp as local HH:MM:SS.
+
+        The UTC offset is looked up for each timestamp, so lines stay in step
+        with the ISO timestamps of the other formats across DST changes.
+
+        Args:
+            timestamp: Seconds since the epoch.
+
+        Returns:
+            Local wall-clock time string.
+        """
+        local = time.localtime(timestamp)
+        return f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}"
+
+    async def save_full_transcript(self) -> Tuple[str, Optional[str]]:
         """Save the complete transcript in text formats.
 
-        Saves both the original transcript and a bilingual version if translation
-        is enabled.
+        Flushes the incrementally written original transcript and saves a
+        bilingual version if translation is enabled. Translation and file
+        writes run off the event loop.
 
         Returns:
             Tuple of (original_file_path, bilingual_file_path). The bilingual
             path is None if translation is disabled.
         """
         original_file = self._save_original_transcript()
-        bilingual_file = self._save_bilingual_transcript()
+        bilingual_file = await self._save_bilingual_transcript()
         return original_file, bilingual_file
 
     def _save_original_transcript(self) -> str:
-        """Save the original transcript without translations.
+        """Flush the original transcript without translations.
+
+        Every entry has already been appended by add_entry, so the file is
+        only flushed rather than rewritten.
 
         Returns:
             Path to the saved original transcript file.
         """
-        with open(self.filename, "w", encoding="utf-8") as f:
-            for entry in self.transcript:
-                f.write(
-                    f"[{entry['timestamp']}] {entry['speaker']}: {entry['message']}\n"
-                )
+        self._flush()
         return self.filename
 
-    def _save_bilingual_transcript(self) -> Optional[str]:
+    async def _save_bilingual_transcript(self) -> Optional[str]:
         """Save a bilingual transcript with original and English translation.
 
         Returns:
@@ -184,54 +618,75 @@ class TranscriptLogger:
         if not self.enable_translation:
             return None
 
+        await self._resolve_translations()
         bilingual_file = f"{self.base_filename}_bilingual.txt"
-        with open(bilingual_file, "w", encoding="utf-8") as f:
-            f.write("=" * 80 + "\n")
-            f.write("BILINGUAL TRANSCRIPT - Original and English Translation\n")
-            f.write("=" * 80 + "\n\n")
-
-            for entry in self.transcript:
-                formatted_entry = self._format_bilingual_entry(entry)
-                f.write(formatted_entry)
+        header = (
+            "=" * 80 + "\n"
+            "BILINGUAL TRANSCRIPT - Original and English Translation\n"
+            + "=" * 80 + "\n\n"
+        )
+        body = "".join(
+            self._format_bilingual_entry(index) for index in range(len(self.messages))
+        )
+        await _write_file(bilingual_file, header + body)
 
         return bilingual_file
 
-    def _format_bilingual_entry(self, entry: Dict[str, Any]) -> str:
+    def _format_bilingual_entry(self, index: int) -> str:
         """Format a single entry for the bilingual transcript.
 
         Args:
-            entry: The transcript entry dictionary.
+            index: Position of the entry in the transcript.
 
         Returns:
             Formatted string for the bilingual transcript.
         """
-        time_str = entry["timestamp"]
-        speaker = entry["speaker"]
-        message = entry["message"]
+        time_str = _isoformat(self.timestamps[index])
+        speaker = self.speakers[index]
+        message = self.messages[index]
 
         formatted = f"[{time_str}] {speaker}:\n"
         formatted += f"  Original: {message}\n"
 
         # Add translation if available
-        if "translated" in entry and entry.get("needs_translation", False):
-            formatted += f"  English:  {entry['translated']}\n"
-            formatted += f"  (Detected: {entry.get('source_language', 'Unknown')})\n"
+        translation = self.translations[index]
+        if translation is not None and translation[2]:
+            translated, source_language, _ = translation
+            formatted += f"  English:  {translated}\n"
+            formatted += f"  (Detected: {source_language})\n"
 
         formatted += "\n"
         return formatted
 
-    def save_json_transcript(self) -> str:
+    async def save_json_transcript(self) -> str:
         """Save the complete transcript as JSON with all metadata.
 
+        Translation and the file write run off the event loop.
+
         Returns:
             Path to the JSON transcript file.
         """
+        await self._resolve_translations()
         json_file = f"{self.base_filename}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(self.transcript, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            payload = orjson.dumps(self.transcript, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(
+                self.transcript, indent=2, ensure_ascii=False
+            ).encode("utf-8")
+        await _write_file(json_file, payload)
 
         return json_file
 
+    def close(self):
+        """Close the transcript file and the translation caches."""
+        self._translation_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+        if not self._fh.closed:
+            self._fh.close()
+
 
 async def bot() -> str:
     """Run the voice-activated hotel receptionist bot.
@@ -240,13 +695,16 @@ async def bot() -> str:
     and logs transcripts with optional translation.
 
     Returns:
-        The full conversation transcript as a formatted string.
+        The full conversation transcript as a formatted string, headed by
+        the session date.
 
     Raises:
         Exception: If there are errors during bot initialization or execution.
     """
+    _configure_logging()
     logger = TranscriptLogger()
-    print(f"Transcript will be saved to: {logger.filename}")
+    await logger.start()
+    log.info("Transcript will be saved to: %s", logger.filename)
 
     agent = _create_agent()
     runner = _create_runner(agent)
@@ -255,16 +713,18 @@ async def bot() -> str:
     try:
         await _handle_conversation_session(session, logger)
     except KeyboardInterrupt:
-        print("\nSession interrupted by user")
+        log.info("Session interrupted by user")
         logger.add_entry("SYSTEM", "Session interrupted by user")
     except Exception as e:
-        print(f"Session error: {e}")
+        log.error("Session error: %s", e)
         logger.add_entry("SYSTEM", f"Session error: {e}")
     finally:
         logger.add_entry("SYSTEM", "Session ended")
-        _save_transcripts(logger)
+        await logger.stop()
+        await _save_transcripts(logger)
+        logger.close()
 
-    return _format_transcript_string(logger.transcript)
+    return logger.transcript_text()
 
 
 def _create_agent() -> RealtimeAgent:
@@ -322,7 +782,7 @@ async def _handle_conversation_session(session, logger: TranscriptLogger):
         logger: TranscriptLogger instance for logging conversation.
     """
     async with session:
-        print("Hotel receptionist agent ready for voice input.")
+        log.info("Hotel receptionist agent ready for voice input.")
         logger.add_entry("SYSTEM", "Hotel receptionist agent started")
 
         async for event in session:
@@ -338,44 +798,30 @@ def _process_conversation_event(event, logger: TranscriptLogger):
     """
     if event.type == "conversation.item.input_audio_transcription.completed":
         user_message = event.transcript
-        print(f"User: {user_message}")
+        log.info("User: %s", user_message)
         logger.add_entry("USER", user_message)
 
     elif event.type == "response.audio_transcript.done":
         agent_message = event.transcript
-        print(f"Receptionist: {agent_message}")
+        log.info("Receptionist: %s", agent_message)
         logger.add_entry("RECEPTIONIST", agent_message)
 
 
-def _save_transcripts(logger: TranscriptLogger):
-    """Save all transcript formats and print file paths.
+async def _save_transcripts(logger: TranscriptLogger):
+    """Save all transcript formats and log file paths.
 
     Args:
         logger: TranscriptLogger instance with conversation data.
     """
-    original_file, bilingual_file = logger.save_full_transcript()
-    json_file = logger.save_json_transcript()
+    (original_file, bilingual_file), json_file = await asyncio.gather(
+        logger.save_full_transcript(), logger.save_json_transcript()
+    )
 
-    print(f"\nTranscripts saved:")
-    print(f"  - Original: {original_file}")
+    log.info("Transcripts saved:")
+    log.info("  - Original: %s", original_file)
     if bilingual_file:
-        print(f"  - Bilingual: {bilingual_file}")
-    print(f"  - JSON: {json_file}")
-
-
-def _format_transcript_string(transcript: list[Dict[str, Any]]) -> str:
-    """Format transcript entries as a single string.
-
-    Args:
-        transcript: List of transcript entry dictionaries.
-
-    Returns:
-        Formatted transcript string with timestamps and speakers.
-    """
-    return "\n".join(
-        f"[{entry['timestamp']}] {entry['speaker']}: {entry['message']}"
-        for entry in transcript
-    )
+        log.info("  - Bilingual: %s", bilingual_file)
+    log.info("  - JSON: %s", json_file)
 
 
 async def main():
@@ -1,21 +1,53 @@
 """This scripts contains the main API functions to call the bot, reader and reservation_db modules.
 Tech: FastAPI"""
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+from functools import partial
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
 from reader import extract_hotel_info
+from models import hotel_request_adapter
 from bot_main import bot as bot_main_async  # main() coroutine with conversation logic
-from reservation_db import insert_into_supabase
+from reservation_db import (
+    UploadQueue,
+    insert_into_supabase,
+    save_request_to_json,
+    sync_journal,
+)
 from supabase import create_client, Client
 
-app = FastAPI()
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder, see the "fast" extra
+    orjson = None
+
+# Responses are built directly from JSON-ready data, so use orjson when present
+DefaultResponse = ORJSONResponse if orjson is not None else JSONResponse
 
 SUPABASE_URL = "YOUR_SUPABASE_URL"
 SUPABASE_KEY = "YOUR_SUPABASE_API_KEY"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the Supabase client once and run the background uploader with it."""
+    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    app.state.supabase = supabase
+    app.state.upload_queue = UploadQueue(partial(insert_into_supabase, supabase))
+    await app.state.upload_queue.start()
+    try:
+        yield
+    finally:
+        await app.state.upload_queue.stop()
+        sync_journal()
+
+
+app = FastAPI(default_response_class=DefaultResponse, lifespan=lifespan)
+
+
 @app.post("/bot")
-async def bot_async_conversation():
+async def bot_async_conversation(request: Request):
     """
     Runs the async conversation flow via bot_main.main().
     Returns the most recently saved reservation (from JSON file).
@@ -24,19 +56,17 @@ async def bot_async_conversation():
     conversation_text = await bot_main_async()
     print("Conversation ended.")
     # use extract_hotel_info from the text
-    reservation = extract_hotel_info(conversation_text)
+    reservation = await extract_hotel_info(conversation_text)
 
-    # Convert reservation object to JSON
-    reservation_json = reservation.model_dump()
+    # Keep a local append-only record of every extracted request
+    save_request_to_json(reservation)
 
-    # Upload to Supabase
-    try:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        insert_into_supabase(supabase, [reservation_json])
-        print("Reservation uploaded to Supabase.")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Supabase upload failed: {e}")
-
-    return JSONResponse(
-        content={"reservation": reservation.model_dump(), "status_code": 200}
+    # Convert reservation object to JSON-compatible data once
+    reservation_json = hotel_request_adapter.dump_python(reservation, mode="json")
+
+    # Queue for Supabase; uploaded in batches by the background uploader
+    request.app.state.upload_queue.put(reservation_json)
+
+    return DefaultResponse(
+        content={"reservation": reservation_json, "status_code": 200}
     )
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field, TypeAdapter
+
+
+class HotelRequest(BaseModel):
+    Available: bool = Field(
+        ..., description="True if room is available, False otherwise"
+    )
+    CheckInDate: str = Field(..., description="Check-in date (YYYY-MM-DD)")
+    CheckoutDate: str = Field(..., description="Check-out date (YYYY-MM-DD)")
+    NumberOfGuests: int = Field(..., description="Number of guests for the reservation")
+    guest_name: str = Field(..., description="Name of the guest")
+    room_type: str = Field(..., description="Requested room type")
+    special_requests: str = Field("", description="Any special requests")
+
+
+# Reusable validators/serializers for HotelRequest payloads
+hotel_request_adapter = TypeAdapter(HotelRequest)
@@ -0,0 +1,103 @@
+"""
+Audio Utilities Module
+
+Single-pass level measurements for captured audio blocks. The reductions are
+compiled with numba when it is installed, or evaluated by numexpr otherwise, so
+peak and energy are computed in one pass over the samples without the |x| or
+x**2 temporaries that the numpy expressions allocate.
+
+Author: Hotel Voice Bot Team
+Date: September 2025
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional JIT
+    njit = None
+
+try:
+    import numexpr
+except ImportError:  # optional fused evaluator, fall back to temporary-free numpy
+    numexpr = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _max_abs(x):
+        peak = 0.0
+        for i in range(x.size):
+            value = abs(x[i])
+            if value > peak:
+                peak = value
+        return peak
+
+    @njit(cache=True, fastmath=True)
+    def _sumsq(x):
+        total = 0.0
+        for i in range(x.size):
+            total += x[i] * x[i]
+        return total
+
+elif numexpr is not None:
+
+    def _max_abs(x):
+        return numexpr.evaluate("max(abs(x))")
+
+    def _sumsq(x):
+        return np.dot(x, x)
+
+else:
+
+    def _max_abs(x):
+        return max(x.max(), -x.min())
+
+    def _sumsq(x):
+        return np.dot(x, x)
+
+
+def max_abs(data: np.ndarray) -> float:
+    """
+    Peak absolute amplitude of an audio buffer.
+
+    Args:
+        data (np.ndarray): Audio samples of any shape
+
+    Returns:
+        float: Largest absolute sample value, 0.0 for an empty buffer
+    """
+    samples = data.ravel()
+    if samples.size == 0:
+        return 0.0
+    return float(_max_abs(samples))
+
+
+def sumsq(data: np.ndarray) -> float:
+    """
+    Sum of squared samples of an audio buffer.
+
+    Args:
+        data (np.ndarray): Audio samples of any shape
+
+    Returns:
+        float: Signal energy
+    """
+    return float(_sumsq(data.ravel()))
+
+
+def rms(data: np.ndarray) -> float:
+    """
+    Root-mean-square level of an audio buffer.
+
+    Args:
+        data (np.ndarray): Audio samples of any shape
+
+    Returns:
+        float: RMS level, 0.0 for an empty buffer
+    """
+    if data.size == 0:
+        return 0.0
+    return math.sqrt(sumsq(data) / data.size)
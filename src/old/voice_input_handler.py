@@ -12,10 +12,20 @@ import asyncio
 import logging
 import numpy as np
 import sounddevice as sd
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Iterator, List, Tuple
 from dataclasses import dataclass
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 import threading
-import queue
+import time
+
+from audio_utils import max_abs, rms
+
+try:
+    import rtmixer
+except ImportError:  # optional C-callback backend
+    rtmixer = None
 
 
 @dataclass
@@ -26,6 +36,156 @@ class AudioConfig:
     chunk_size: int = 1024
     dtype: str = 'float32'
     device_id: Optional[int] = None
+    ring_capacity: int = 64
+    pool_size: int = 8
+    backend: str = 'sounddevice'  # or 'rtmixer' for a C-only real-time callback
+
+
+# Seconds between input overflow checks on the rtmixer backend
+STATS_INTERVAL = 1.0
+
+
+@lru_cache(maxsize=1)
+def _query_input_devices() -> tuple:
+    """
+    Enumerate PortAudio input devices once and cache the result.
+    
+    Returns:
+        tuple: Device information dictionaries for devices with inputs
+    """
+    return tuple(
+        {
+            'id': i,
+            'name': device['name'],
+            'channels': device['max_input_channels'],
+            'sample_rate': device['default_samplerate']
+        }
+        for i, device in enumerate(sd.query_devices())
+        if device['max_input_channels'] > 0
+    )
+
+
+def _next_pow2(n: int) -> int:
+    """Smallest power of two greater than or equal to n."""
+    return 1 << max(n - 1, 0).bit_length()
+
+
+class AudioRingBuffer:
+    """
+    Preallocated single-producer/single-consumer ring buffer of audio blocks.
+    
+    The producer (the PortAudio callback thread) only ever advances the write
+    index and the consumer only ever advances the read index, so neither side
+    takes a lock and the real-time thread never blocks or allocates. When the
+    consumer falls behind, the producer keeps writing and overwrites the
+    oldest blocks; the consumer skips ahead and counts them as overruns.
+    """
+    
+    def __init__(self, capacity: int, block_shape: tuple, dtype=np.float32):
+        """
+        Initialize the ring buffer.
+        
+        Args:
+            capacity (int): Number of blocks, must be a power of two
+            block_shape (tuple): Shape of a single audio block (frames, channels)
+            dtype: Sample data type
+        """
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("Ring buffer capacity must be a power of two")
+        self._slots = np.zeros((capacity,) + tuple(block_shape), dtype=dtype)
+        self._mask = capacity - 1
+        self._write_index = 0
+        self._read_index = 0
+        self.overruns = 0
+        
+    @property
+    def capacity(self) -> int:
+        """Number of blocks the buffer can hold."""
+        return self._mask + 1
+        
+    def read_available(self) -> int:
+        """
+        Number of blocks written but not yet read.
+        
+        At most capacity - 1: when the ring is full, the oldest block is the
+        one the producer overwrites next and read() drops it as an overrun.
+        
+        Returns:
+            int: Pending block count
+        """
+        return min(self._write_index - self._read_index, self.capacity - 1)
+        
+    def write_slot(self) -> np.ndarray:
+        """
+        View of the next slot, to be filled in place (producer side).
+        
+        The block becomes visible to the consumer only after commit(). If the
+        buffer is full this is the oldest unread block, which gets overwritten.
+        
+        Returns:
+            np.ndarray: Writable slot view
+        """
+        return self._slots[self._write_index & self._mask]
+        
+    def commit(self):
+        """
+        Publish the slot returned by write_slot() to the consumer.
+        """
+        self._write_index += 1
+        
+    def write(self, block: np.ndarray) -> np.ndarray:
+        """
+        Copy a block into the next slot, overwriting the oldest if full.
+        
+        Args:
+            block (np.ndarray): Audio block matching the slot shape
+            
+        Returns:
+            np.ndarray: The filled slot (valid until the ring wraps)
+        """
+        slot = self.write_slot()
+        np.copyto(slot, block)
+        self.commit()
+        return slot
+        
+    def read(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Copy out the oldest pending block (consumer side).
+        
+        Args:
+            out (np.ndarray): Optional preallocated array to copy the block into
+            
+        Returns:
+            Optional[np.ndarray]: Audio block or None if the buffer is empty
+        """
+        capacity = self.capacity
+        while True:
+            read_index = self._read_index
+            lag = self._write_index - read_index
+            if lag == 0:
+                return None
+            if lag >= capacity:
+                # Full or lapped: the oldest slot is the producer's next write,
+                # so treat it as lost and skip to the oldest block still intact
+                self.overruns += lag - capacity + 1
+                self._read_index = read_index = self._write_index - capacity + 1
+                
+            slot = self._slots[read_index & self._mask]
+            if out is None:
+                out = slot.copy()
+            else:
+                np.copyto(out, slot)
+                
+            # If the producer reached this slot while we copied, retry
+            if self._write_index - read_index < capacity:
+                self._read_index = read_index + 1
+                return out
+            
+    def clear(self):
+        """
+        Discard all pending blocks (consumer side).
+        """
+        self._read_index = self._write_index
 
 
 class VoiceInputHandler:
@@ -46,18 +206,42 @@ class VoiceInputHandler:
         """
         self.config = config or AudioConfig()
         self.is_recording = False
-        self.audio_queue = queue.Queue()
-        self.callbacks: List[Callable] = []
+        self._block_shape = (self.config.chunk_size, self.config.channels)
+        self.audio_ring = AudioRingBuffer(self.config.ring_capacity, self._block_shape)
+        # Freelist of float32 blocks handed out to consumers
+        self._pool = deque(
+            (np.empty(self._block_shape, dtype=np.float32)
+             for _ in range(self.config.pool_size)),
+            maxlen=self.config.pool_size
+        )
+        # Consumer polls at a quarter of a block period while waiting for audio
+        self._poll_interval = self.config.chunk_size / self.config.sample_rate / 4
+        # Copy-on-write tuples: the audio thread reads a stable snapshot
+        self._callbacks: Tuple[Tuple[Callable, Callable], ...] = ()
+        self._dispatch: Tuple[Callable, ...] = ()
+        self._mic_test_buffer: Optional[np.ndarray] = None
         self.logger = logging.getLogger(__name__)
         
-    def add_callback(self, callback: Callable):
+    @property
+    def callbacks(self) -> List[Callable]:
+        """Registered callback functions, in call order."""
+        return [callback for callback, _ in self._callbacks]
+        
+    def add_callback(self, callback: Callable, rt_safe: bool = False):
         """
         Add a callback function to be called when audio is captured.
         
+        The audio block passed to the callback is recycled once all callbacks
+        have returned, so callbacks that keep the data must copy it.
+        
         Args:
             callback (Callable): Function to call with audio data
+            rt_safe (bool): If True the callback is called directly, without
+                the error-logging guard; exceptions it raises abort the stream
         """
-        self.callbacks.append(callback)
+        dispatch = callback if rt_safe else self._guard_callback(callback)
+        self._callbacks = self._callbacks + ((callback, dispatch),)
+        self._dispatch = tuple(d for _, d in self._callbacks)
         
     def remove_callback(self, callback: Callable):
         """
@@ -66,8 +250,30 @@ class VoiceInputHandler:
         Args:
             callback (Callable): Function to remove
         """
-        if callback in self.callbacks:
-            self.callbacks.remove(callback)
+        self._callbacks = tuple(
+            (cb, d) for cb, d in self._callbacks if cb is not callback
+        )
+        self._dispatch = tuple(d for _, d in self._callbacks)
+        
+    def _guard_callback(self, callback: Callable) -> Callable:
+        """
+        Wrap a callback so its exceptions are logged instead of raised.
+        
+        Args:
+            callback (Callable): Function to wrap
+            
+        Returns:
+            Callable: Fault-tolerant wrapper
+        """
+        logger = self.logger
+        
+        def guarded(audio_data):
+            try:
+                callback(audio_data)
+            except Exception as e:
+                logger.error(f"Error in audio callback: {e}")
+                
+        return guarded
     
     def _audio_callback(self, indata, frames, time, status):
         """
@@ -82,21 +288,65 @@ class VoiceInputHandler:
         if status:
             self.logger.warning(f"Audio input status: {status}")
             
-        # Convert to float32 and normalize
-        audio_data = indata.copy().astype(np.float32)
+        # Copy straight into the ring: the only memcpy of the block, and the
+        # filled slot is handed to callbacks without a second copy
+        self._dispatch_callbacks(self.audio_ring.write(indata))
+        
+    def _dispatch_rtmixer_audio(self):
+        """
+        Consumer thread for the rtmixer backend.
+        
+        Drains the C ring buffer filled by rtmixer's callback and runs the
+        Python-side processing (ring hand-off, user callbacks, logging) here,
+        outside PortAudio's real-time thread.
+        """
+        frames = self.config.chunk_size
+        overflows = 0
+        stats_action = None
+        next_stats = time.monotonic() + STATS_INTERVAL
+        while not self._dispatch_stop.is_set():
+            # .stats cannot be read on an active stream, so ask the C callback
+            # for its counters through a fetch-and-reset action now and then
+            if stats_action is not None and stats_action not in self.stream.actions:
+                if stats_action.stats.input_overflows:
+                    overflows += stats_action.stats.input_overflows
+                    self.logger.warning(f"Audio input overflows: {overflows}")
+                stats_action = None
+            if stats_action is None and time.monotonic() >= next_stats:
+                stats_action = self.stream.fetch_and_reset_stats()
+                next_stats = time.monotonic() + STATS_INTERVAL
+                
+            if self._rt_ring.read_available < frames:
+                time.sleep(self._poll_interval)
+                continue
+                
+            # Read from the C ring straight into the next Python ring slot
+            slot = self.audio_ring.write_slot()
+            self._rt_ring.readinto(slot)
+            self.audio_ring.commit()
+            self._dispatch_callbacks(slot)
+                
+    def _dispatch_callbacks(self, audio_data: np.ndarray):
+        """
+        Call registered callbacks with a captured block.
+        
+        Args:
+            audio_data (np.ndarray): Float32 block, reused after the callbacks return
+        """
+        for callback in self._dispatch:
+            callback(audio_data)
+        
+    def _acquire_buffer(self) -> np.ndarray:
+        """
+        Take a float32 block from the pool, allocating only if it is empty.
         
-        # Add to queue
+        Returns:
+            np.ndarray: Block shaped (chunk_size, channels)
+        """
         try:
-            self.audio_queue.put_nowait(audio_data)
-        except queue.Full:
-            self.logger.warning("Audio queue is full, dropping frames")
-            
-        # Call registered callbacks
-        for callback in self.callbacks:
-            try:
-                callback(audio_data)
-            except Exception as e:
-                self.logger.error(f"Error in audio callback: {e}")
+            return self._pool.pop()
+        except IndexError:
+            return np.empty(self._block_shape, dtype=np.float32)
     
     def start_recording(self) -> bool:
         """
@@ -110,16 +360,19 @@ class VoiceInputHandler:
             return False
             
         try:
-            self.stream = sd.InputStream(
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                blocksize=self.config.chunk_size,
-                dtype=self.config.dtype,
-                device=self.config.device_id,
-                callback=self._audio_callback
-            )
-            
-            self.stream.start()
+            if self.config.backend == 'rtmixer':
+                self._start_rtmixer_stream()
+            else:
+                self.stream = sd.InputStream(
+                    samplerate=self.config.sample_rate,
+                    channels=self.config.channels,
+                    blocksize=self.config.chunk_size,
+                    dtype=self.config.dtype,
+                    device=self.config.device_id,
+                    callback=self._audio_callback
+                )
+                self.stream.start()
+                
             self.is_recording = True
             self.logger.info("Audio recording started")
             return True
@@ -127,6 +380,39 @@ class VoiceInputHandler:
         except Exception as e:
             self.logger.error(f"Failed to start recording: {e}")
             return False
+            
+    def _start_rtmixer_stream(self):
+        """
+        Start an rtmixer Recorder whose C callback fills a ring buffer.
+        
+        Raises:
+            RuntimeError: If rtmixer is not installed
+        """
+        if rtmixer is None:
+            raise RuntimeError("The 'rtmixer' backend requires python-rtmixer")
+            
+        frame_bytes = self.config.channels * np.dtype(np.float32).itemsize
+        self._rt_ring = rtmixer.RingBuffer(
+            frame_bytes,
+            _next_pow2(self.config.ring_capacity * self.config.chunk_size)
+        )
+        self.stream = rtmixer.Recorder(
+            device=self.config.device_id,
+            channels=self.config.channels,
+            blocksize=self.config.chunk_size,
+            samplerate=self.config.sample_rate,
+            dtype='float32'
+        )
+        self.stream.start()
+        self._rt_action = self.stream.record_ringbuffer(
+            self._rt_ring, allow_belated=True
+        )
+        
+        self._dispatch_stop = threading.Event()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_rtmixer_audio, daemon=True
+        )
+        self._dispatch_thread.start()
     
     def stop_recording(self):
         """
@@ -136,6 +422,9 @@ class VoiceInputHandler:
             return
             
         try:
+            if self.config.backend == 'rtmixer':
+                self._dispatch_stop.set()
+                self._dispatch_thread.join()
             self.stream.stop()
             self.stream.close()
             self.is_recording = False
@@ -146,7 +435,10 @@ class VoiceInputHandler:
     
     def get_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
-        Get the next audio chunk from the queue.
+        Get the next audio chunk from the ring buffer.
+        
+        The chunk is taken from the handler's buffer pool; pass it to
+        release_audio_chunk() (or use audio_chunk()) once done with it.
         
         Args:
             timeout (float): Timeout in seconds
@@ -154,46 +446,77 @@ class VoiceInputHandler:
         Returns:
             Optional[np.ndarray]: Audio data or None if timeout
         """
+        buffer = self._acquire_buffer()
+        deadline = time.monotonic() + timeout
+        while True:
+            overruns = self.audio_ring.overruns
+            if self.audio_ring.read(out=buffer) is not None:
+                if self.audio_ring.overruns != overruns:
+                    dropped = self.audio_ring.overruns - overruns
+                    self.logger.warning(
+                        f"Audio consumer fell behind, dropped {dropped} oldest blocks"
+                    )
+                return buffer
+            if time.monotonic() >= deadline:
+                self._pool.append(buffer)
+                return None
+            time.sleep(self._poll_interval)
+            
+    def release_audio_chunk(self, chunk: np.ndarray):
+        """
+        Return a chunk obtained from get_audio_chunk() to the buffer pool.
+        
+        Args:
+            chunk (np.ndarray): Chunk to recycle
+        """
+        if chunk is not None and chunk.shape == self._block_shape:
+            self._pool.append(chunk)
+            
+    @contextmanager
+    def audio_chunk(self, timeout: float = 1.0) -> Iterator[Optional[np.ndarray]]:
+        """
+        Context manager yielding the next audio chunk and recycling it on exit.
+        
+        Args:
+            timeout (float): Timeout in seconds
+            
+        Yields:
+            Optional[np.ndarray]: Audio data or None if timeout
+        """
+        chunk = self.get_audio_chunk(timeout)
         try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+            yield chunk
+        finally:
+            self.release_audio_chunk(chunk)
     
     def clear_audio_queue(self):
         """
-        Clear all pending audio data from the queue.
+        Clear all pending audio data from the ring buffer.
         """
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.audio_ring.clear()
     
     def get_available_devices(self) -> List[dict]:
         """
         Get list of available audio input devices.
         
+        The device list is enumerated once and cached; call
+        refresh_devices() after plugging in or removing hardware.
+        
         Returns:
             List[dict]: List of device information dictionaries
         """
         try:
-            devices = sd.query_devices()
-            input_devices = []
-            
-            for i, device in enumerate(devices):
-                if device['max_input_channels'] > 0:
-                    input_devices.append({
-                        'id': i,
-                        'name': device['name'],
-                        'channels': device['max_input_channels'],
-                        'sample_rate': device['default_samplerate']
-                    })
-                    
-            return input_devices
+            return [dict(device) for device in _query_input_devices()]
             
         except Exception as e:
             self.logger.error(f"Error querying devices: {e}")
             return []
+            
+    def refresh_devices(self):
+        """
+        Drop the cached device list so the next query re-enumerates devices.
+        """
+        _query_input_devices.cache_clear()
     
     def test_microphone(self, duration: float = 2.0) -> bool:
         """
@@ -206,17 +529,20 @@ class VoiceInputHandler:
             bool: True if microphone is working, False otherwise
         """
         try:
+            # Record into a scratch buffer kept across tests
+            frames = int(duration * self.config.sample_rate)
+            shape = (frames, self.config.channels)
+            if self._mic_test_buffer is None or self._mic_test_buffer.shape != shape:
+                self._mic_test_buffer = np.empty(shape, dtype=self.config.dtype)
             recording = sd.rec(
-                int(duration * self.config.sample_rate),
+                out=self._mic_test_buffer,
                 samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                dtype=self.config.dtype,
                 device=self.config.device_id
             )
             sd.wait()
             
             # Check if we got actual audio data
-            if np.max(np.abs(recording)) > 0.001:  # Threshold for detecting audio
+            if max_abs(recording) > 0.001:  # Threshold for detecting audio
                 self.logger.info("Microphone test successful")
                 return True
             else:
@@ -260,7 +586,7 @@ if __name__ == "__main__":
     # Example of using the handler
     def audio_callback(data):
         """Example callback function."""
-        volume = np.sqrt(np.mean(data**2))
+        volume = rms(data)
         if volume > 0.01:  # Threshold for voice activity
             print(f"Voice detected! Volume: {volume:.3f}")
     
@@ -269,7 +595,6 @@ if __name__ == "__main__":
     
     print("\nStarting recording for 5 seconds...")
     with handler:
-        import time
         time.sleep(5)
     
     print("Recording finished.")
@@ -1,20 +1,14 @@
-from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from typing import Optional
+from collections import OrderedDict
 import os
-from datetime import datetime, timedelta
+from models import HotelRequest, hotel_request_adapter
 
 
-class HotelRequest(BaseModel):
-    Available: bool = Field(
-        ..., description="True if room is available, False otherwise"
-    )
-    CheckInDate: str = Field(..., description="Check-in date (YYYY-MM-DD)")
-    CheckoutDate: str = Field(..., description="Check-out date (YYYY-MM-DD)")
-    NumberOfGuests: int = Field(..., description="Number of guests for the reservation")
-    guest_name: str = Field(..., description="Name of the guest")
-    room_type: str = Field(..., description="Requested room type")
-    special_requests: str = Field("", description="Any special requests")
+# Most recent extractions keyed by input text, oldest first
+EXTRACTION_CACHE_SIZE = 256
+_extraction_cache: "OrderedDict[str, HotelRequest]" = OrderedDict()
+_key_set = False
 
 
 # Create the PydanticAI agent
@@ -54,22 +48,50 @@ async def extract_hotel_info(text: str, api_key: Optional[str] = None) -> HotelR
         ValueError: If API key is not provided or found in environment
         Exception: If extraction fails
     """
+    _ensure_key(api_key)
 
+    # Repeated texts (retries, tests) are answered without another LLM call
+    cached = _extraction_cache.get(text)
+    if cached is not None:
+        _extraction_cache.move_to_end(text)
+        return cached.model_copy()
+
+    try:
+        # Run the agent to extract information
+        result = await hotel_agent.run(text)
+    except Exception as e:
+        raise Exception(f"Failed to extract hotel information: {str(e)}")
+
+    request = hotel_request_adapter.validate_python(result.data)
+    _extraction_cache[text] = request
+    if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+        _extraction_cache.popitem(last=False)
+    return request.model_copy()
+
+
+def _ensure_key(api_key: Optional[str] = None):
+    """
+    Make sure the OpenAI API key is configured, checking the environment only once.
+
+    An explicit api_key is always exported, so a later call can switch keys.
+
+    Args:
+        api_key (str, optional): OpenAI API key to export as OPENAI_API_KEY
+
+    Raises:
+        ValueError: If API key is not provided or found in environment
+    """
+    global _key_set
     # Set API key if provided
     if api_key:
         os.environ["OPENAI_API_KEY"] = api_key
+    elif _key_set:
+        return
     elif not os.getenv("OPENAI_API_KEY"):
         raise ValueError(
             "OpenAI API key must be provided either as parameter or OPENAI_API_KEY environment variable"
         )
-
-    try:
-        # Run the agent to extract information
-        result = await hotel_agent.run(text)
-        return result.data
-
-    except Exception as e:
-        raise Exception(f"Failed to extract hotel information: {str(e)}")
+    _key_set = True
 
     # Example usage
 
@@ -1,15 +1,97 @@
-import os
+import asyncio
 import json
-from supabase import create_client, Client
+import os
+import sys
+from pydantic_core import from_json
+from supabase import acreate_client, AsyncClient, Client
+from models import hotel_request_adapter
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder, see the "fast" extra
+    orjson = None
 
 SUPABASE_URL = "YOUR_SUPABASE_URL"
 SUPABASE_KEY = "YOUR_SUPABASE_API_KEY"
 TABLE_NAME = "hotel_reservations"  # Make sure this matches your Supabase table
+BATCH_SIZE = 500  # rows per insert request
+REQUESTS_FILE = "hotel_requests.jsonl"  # append-only journal, one request per line
+FLUSH_ROWS = 50  # queued rows that trigger an upload
+FLUSH_INTERVAL = 2.0  # seconds a queued row may wait before upload
+UPLOAD_RETRIES = 3  # extra attempts for a failed upload, with doubling delays
+RETRY_DELAY = 1.0  # seconds before the first retry
+FAILED_UPLOADS_FILE = "failed_uploads.jsonl"  # rows still missing from Supabase
+
+_journal_fds = {}  # filename -> O_APPEND descriptor kept open across saves
+
+
+def _loads(data):
+    # jiter reuses one Python str per repeated key/value (room types, dates, ...)
+    return from_json(data, cache_strings="all")
+
+
+def _journal_array(filename):
+    # Join the journal lines into one JSON array so it is parsed in a single call
+    with open(filename, "rb") as f:
+        return b"[" + b",".join(line for line in f if line.strip()) + b"]"
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 def load_json(filename):
-    with open(filename, "r") as f:
-        return json.load(f)
+    # Parse the raw bytes in one call instead of json.load's text decoding
+    with open(filename, "rb") as f:
+        return _loads(f.read())
+
+
+def load_jsonl(filename=REQUESTS_FILE):
+    return _loads(_journal_array(filename))
+
+
+def _journal_fd(filename):
+    fd = _journal_fds.get(filename)
+    if fd is None:
+        fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _journal_fds[filename] = fd
+    return fd
+
+
+def save_request_to_json(request, filename=REQUESTS_FILE):
+    # Append one serialized line with a single write(2): O(1) per request, no
+    # read-modify-write cycle, and O_APPEND keeps concurrent lines whole.
+    # dump_json returns bytes straight from pydantic-core, no str round-trip
+    payload = hotel_request_adapter.dump_json(request, exclude_none=True) + b"\n"
+    os.write(_journal_fd(filename), payload)
+
+
+def sync_journal():
+    # fsync once at shutdown instead of per record, then release the descriptors
+    while _journal_fds:
+        _, fd = _journal_fds.popitem()
+        os.fsync(fd)
+        os.close(fd)
+
+
+def _append_rows(filename, rows):
+    # Opened per call so retry_failed_uploads can move the file aside safely
+    fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, b"".join(_dumps(row) + b"\n" for row in rows))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def compact_jsonl(src=REQUESTS_FILE, dst="hotel_requests.json"):
+    # Emit the journal as a single JSON array for consumers that need one
+    records = load_jsonl(src)
+    with open(dst, "wb") as f:
+        f.write(_dumps(records))
+    return dst
 
 
 def insert_into_supabase(supabase: Client, reservations):
@@ -17,13 +99,159 @@ def insert_into_supabase(supabase: Client, reservations):
     print("Insertion results:", data)
 
 
-def main():
-    reservations = load_json("hotel_requests.json")
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    # reservations is a list of dicts; can also insert one at a time if needed
-    insert_into_supabase(supabase, reservations)
-    print("All reservations from JSON inserted into Supabase.")
+def _batches(rows, batch_size=BATCH_SIZE):
+    return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+
+
+async def insert_batches(
+    supabase: AsyncClient, reservations, batch_size=BATCH_SIZE, return_exceptions=False
+):
+    # Issue one insert per batch concurrently instead of serializing round-trips;
+    # with return_exceptions a failed batch's result is its exception
+    batches = _batches(reservations, batch_size)
+    results = await asyncio.gather(
+        *(supabase.table(TABLE_NAME).insert(batch).execute() for batch in batches),
+        return_exceptions=return_exceptions,
+    )
+    inserted = sum(
+        len(batch)
+        for batch, result in zip(batches, results)
+        if not isinstance(result, BaseException)
+    )
+    print(f"Inserted {inserted} of {len(reservations)} rows in {len(batches)} batches")
+    return results
+
+
+async def import_reservations(supabase: AsyncClient, filename="hotel_requests.json"):
+    # Bulk-load an export (compact_jsonl's JSON array, or a journal) into a table
+    # that does not hold these rows yet
+    if filename.endswith(".jsonl"):
+        reservations = load_jsonl(filename)
+    else:
+        reservations = load_json(filename)
+    await insert_batches(supabase, reservations)
+    return len(reservations)
+
+
+class UploadQueue:
+    # Buffers rows in-process so callers return immediately; a background task
+    # uploads everything queued in one insert every FLUSH_ROWS rows or FLUSH_INTERVAL seconds,
+    # retrying failed inserts before setting the rows aside in FAILED_UPLOADS_FILE
+    def __init__(
+        self,
+        insert,
+        flush_rows=FLUSH_ROWS,
+        flush_interval=FLUSH_INTERVAL,
+        retries=UPLOAD_RETRIES,
+        retry_delay=RETRY_DELAY,
+        failed_file=FAILED_UPLOADS_FILE,
+    ):
+        self.insert = insert  # blocking callable taking a list of rows
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failed_file = failed_file
+        self._queue = None
+        self._task = None
+
+    def put(self, row):
+        self._queue.put_nowait(row)
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        # Sentinel makes the task upload what is left and exit
+        await self._queue.put(None)
+        await self._task
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        rows = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            stop = False
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout)
+                if row is None:
+                    stop = True
+                else:
+                    rows.append(row)
+                    if deadline is None:
+                        deadline = loop.time() + self.flush_interval
+            except asyncio.TimeoutError:
+                pass
+
+            if rows and (stop or len(rows) >= self.flush_rows or loop.time() >= deadline):
+                await self._flush(rows)
+                rows = []
+                deadline = None
+            if stop:
+                return
+
+    async def _flush(self, rows):
+        for attempt in range(self.retries + 1):
+            try:
+                await asyncio.to_thread(self.insert, rows)
+                return
+            except Exception as e:
+                error = e
+            if attempt < self.retries:
+                await asyncio.sleep(self.retry_delay * 2**attempt)
+
+        # Keep the batch for retry_failed_uploads(); the journal holds every row,
+        # uploaded or not, so re-inserting from it would duplicate rows
+        print(f"Supabase upload of {len(rows)} rows failed: {error}")
+        print(f"Saved them to {self.failed_file} for retry_failed_uploads()")
+        await asyncio.to_thread(_append_rows, self.failed_file, rows)
+
+
+async def retry_failed_uploads(supabase: AsyncClient, filename=FAILED_UPLOADS_FILE):
+    # Move the file aside first so rows that fail meanwhile start a new one; a
+    # leftover file from an interrupted retry is uploaded before anything newer
+    pending = filename + ".retry"
+    if not os.path.exists(pending):
+        try:
+            os.replace(filename, pending)
+        except FileNotFoundError:
+            return 0
+
+    rows = load_jsonl(pending)
+    results = await insert_batches(supabase, rows, return_exceptions=True) if rows else []
+    # Keep only the batches that failed again, so the next retry cannot
+    # re-insert rows that made it this time
+    failed = [
+        row
+        for batch, result in zip(_batches(rows), results)
+        if isinstance(result, BaseException)
+        for row in batch
+    ]
+    if failed:
+        tmp = pending + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(_dumps(row) + b"\n" for row in failed))
+        os.replace(tmp, pending)
+    else:
+        os.remove(pending)
+    return len(rows) - len(failed)
+
+
+async def main():
+    supabase: AsyncClient = await acreate_client(SUPABASE_URL, SUPABASE_KEY)
+    if len(sys.argv) > 1:
+        # python reservation_db.py hotel_requests.json seeds a table from an export
+        count = await import_reservations(supabase, sys.argv[1])
+        print(f"Imported {count} reservations from {sys.argv[1]} into Supabase.")
+        return
+
+    # The server uploads each request as it is saved, so only send the rows
+    # whose upload failed instead of the whole journal
+    count = await retry_failed_uploads(supabase)
+    print(f"Re-uploaded {count} failed reservations to Supabase.")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
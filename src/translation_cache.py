@@ -0,0 +1,148 @@
+"""Persistent translation cache for transcript translations.
+
+Translations are stored in a small SQLite database so that phrases repeated
+across sessions ("Bonjour", "Dos personas", confirmations) are translated by
+the API only once.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+# Default location of the cache database
+DEFAULT_CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "hotel_bot",
+    "translations.sqlite3",
+)
+
+# Cached translations older than this many seconds are ignored and evicted
+DEFAULT_TTL = 30 * 24 * 3600
+
+Translation = Tuple[str, str, bool]
+
+
+def _cache_key(text: str, target_language: str) -> str:
+    """Hash a text and its target language into a fixed-size cache key.
+
+    Args:
+        text: Original text.
+        target_language: Language the text is translated to.
+
+    Returns:
+        Hex digest identifying the translation.
+    """
+    data = f"{target_language}\x1f{text}".encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class TranslationDiskCache:
+    """SQLite-backed cache of (translated, source_language, needs_translation).
+
+    Attributes:
+        path: Path to the SQLite database file.
+        ttl: Maximum age of a cached translation in seconds.
+        target_language: Language the cached translations are in.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_FILE,
+        ttl: float = DEFAULT_TTL,
+        target_language: str = "English",
+    ):
+        """Open the cache database, creating it if needed.
+
+        Expired rows are evicted when the cache is opened.
+
+        Args:
+            path: Path to the SQLite database file.
+            ttl: Maximum age of a cached translation in seconds.
+            target_language: Language the cached translations are in.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.target_language = target_language
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Saves resolve translations on a worker thread, one at a time
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "hash TEXT PRIMARY KEY, translated TEXT, source_language TEXT, "
+            "needs_translation INTEGER, ts REAL)"
+        )
+        self._db.execute("DELETE FROM translations WHERE ts < ?", (time.time() - ttl,))
+        self._db.commit()
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, Translation]:
+        """Look up cached translations.
+
+        Args:
+            texts: Texts to look up.
+
+        Returns:
+            Dictionary mapping each text found in the cache to its translation.
+        """
+        keys = {_cache_key(text, self.target_language): text for text in texts}
+        if not keys:
+            return {}
+
+        placeholders = ",".join("?" * len(keys))
+        rows = self._db.execute(
+            "SELECT hash, translated, source_language, needs_translation "
+            f"FROM translations WHERE ts >= ? AND hash IN ({placeholders})",
+            (time.time() - self.ttl, *keys),
+        )
+        return {
+            keys[key]: (translated, source_language, bool(needs_translation))
+            for key, translated, source_language, needs_translation in rows
+        }
+
+    def put_many(self, translations: Dict[str, Translation]):
+        """Store translations, replacing existing entries.
+
+        Args:
+            translations: Dictionary mapping original texts to translations.
+        """
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    _cache_key(text, self.target_language),
+                    translated,
+                    source_language,
+                    int(needs_translation),
+                    now,
+                )
+                for text, (translated, source_language, needs_translation)
+                in translations.items()
+            ],
+        )
+        self._db.commit()
+
+    def close(self):
+        """Close the cache database."""
+        self._db.close()
+
+
+def open_cache(path: Optional[str] = DEFAULT_CACHE_FILE) -> Optional[TranslationDiskCache]:
+    """Open the translation cache, or return None if it is disabled or unavailable.
+
+    Args:
+        path: Path to the SQLite database file, or None to disable the cache.
+
+    Returns:
+        TranslationDiskCache instance, or None.
+    """
+    if path is None:
+        return None
+    try:
+        return TranslationDiskCache(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: Could not open translation cache {path}: {e}")
+        return None
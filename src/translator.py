@@ -5,10 +5,237 @@ OpenAI API. It is designed to help hotel staff review conversations in languages
 they may not speak.
 """
 
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from openai import OpenAI
 from typing import Optional, Dict
 
+try:
+    from lingua import Language, LanguageDetectorBuilder
+except ImportError:  # optional local language detection
+    Language = LanguageDetectorBuilder = None
+
+# Maximum number of distinct texts remembered by each cache
+CACHE_SIZE = 4096
+
+# Maximum number of OpenAI requests batch_translate() has in flight at once
+MAX_CONCURRENCY = 8
+
+# Maximum number of texts sent in one batch translation request
+BATCH_TRANSLATION_SIZE = 20
+
+# Output token budget per text, capped below gpt-4o-mini's 16,384 token limit
+BATCH_TOKENS_PER_TEXT = 500
+MAX_BATCH_TOKENS = 16000
+
+# Languages the local detector tells apart. Loading high-accuracy models for
+# all of lingua's 75 languages takes about 1 GB and several seconds
+LOCAL_LANGUAGES = (
+    "ENGLISH", "FRENCH", "SPANISH", "GERMAN", "ITALIAN", "PORTUGUESE",
+    "DUTCH", "POLISH", "SWEDISH", "TURKISH", "GREEK", "RUSSIAN",
+    "ARABIC", "HINDI", "CHINESE", "JAPANESE", "KOREAN",
+)
+
+# Local detections below this confidence are sent to OpenAI instead
+MIN_LOCAL_CONFIDENCE = 0.5
+
+# Common English words that rarely appear in other languages written in ASCII
+_ENGLISH_STOPWORDS = frozenset(
+    {"the", "and", "is", "you", "your", "my", "for", "with", "please", "thank",
+     "we", "have", "would", "like", "need", "this", "that", "what", "can"}
+)
+
+
+def _looks_english(text: str) -> bool:
+    """Cheaply recognise plain English text without any model or API call.
+
+    Args:
+        text: Text to check.
+
+    Returns:
+        True if the first 200 characters are pure ASCII and one of the first
+        20 words is a common English stopword.
+    """
+    head = text[:200]
+    if not head.isascii():
+        return False
+    words = head.lower().split()[:20]
+    return any(word.strip(".,!?;:'\"()") in _ENGLISH_STOPWORDS for word in words)
+
+
+_detector = None
+_detector_lock = threading.Lock()
+
+
+def load_language_detector():
+    """Build the local lingua detector for LOCAL_LANGUAGES once.
+
+    Low accuracy mode keeps only the trigram models (about 40 MB, loaded in
+    a fraction of a second); texts it is unsure about still go to the API.
+    Loading blocks, so callers on an event loop should run this in a worker
+    thread.
+
+    Returns:
+        The lingua LanguageDetector, or None when lingua is not installed.
+    """
+    global _detector
+    if LanguageDetectorBuilder is None:
+        return None
+
+    with _detector_lock:
+        if _detector is None:
+            languages = [getattr(Language, name) for name in LOCAL_LANGUAGES]
+            _detector = (
+                LanguageDetectorBuilder.from_languages(*languages)
+                .with_low_accuracy_mode()
+                .with_preloaded_language_models()
+                .build()
+            )
+    return _detector
+
+
+def _detect_language_locally(text: str, load: bool = True) -> Optional[str]:
+    """Detect the language of a text with the local lingua model.
+
+    Args:
+        text: Text to detect language for.
+        load: Whether to build the detector if it is not loaded yet. When
+            False, the detector is only used once it has been loaded.
+
+    Confidences are only relative to LOCAL_LANGUAGES, so text in any other
+    language is pushed onto one of them. A wrong non-English verdict still
+    gets the text translated, but a wrong "English" would leave it
+    untranslated for good, so English verdicts are left to the API.
+
+    Returns:
+        Language name (e.g., "Spanish"), or None when the detector is not
+        available, its confidence is below MIN_LOCAL_CONFIDENCE, or it says
+        "English".
+    """
+    detector = load_language_detector() if load else _detector
+    if detector is None:
+        return None
+
+    confidences = detector.compute_language_confidence_values(text[:200])
+    if not confidences or confidences[0].value < MIN_LOCAL_CONFIDENCE:
+        return None
+    language = confidences[0].language.name.title()
+    return None if language == "English" else language
+
+
+def _detect_language_cheaply(text: str, load: bool = True) -> Optional[str]:
+    """Detect a language without calling the API.
+
+    Args:
+        text: Text to detect language for.
+        load: Whether the local model may be loaded for this call.
+
+    Returns:
+        Language name, or None when neither the English prefilter nor the
+        local model is confident.
+    """
+    return "English" if _looks_english(text) else _detect_language_locally(text, load)
+
+
+def _language_detection_request(text: str) -> dict:
+    """Build the chat completion arguments for language detection.
+
+    Args:
+        text: Text to detect language for.
+
+    Returns:
+        Keyword arguments for ``chat.completions.create``.
+    """
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": (
+                    "You are a language detection expert. Respond with ONLY "
+                    "the language name (e.g., 'English', 'Spanish', 'French', "
+                    "'German', 'Italian', 'Chinese', 'Japanese', etc.). "
+                    "If you cannot determine the language, respond with 'Unknown'."
+                ),
+            },
+            {
+                "role": "user",
+                "content": f"What language is this text in? Text: {text[:200]}",
+            },
+        ],
+        "temperature": 0,
+        "max_tokens": 10,
+    }
+
+
+def _translation_request(text: str, source_language: str) -> dict:
+    """Build the chat completion arguments for translation to English.
+
+    Args:
+        text: Text to translate.
+        source_language: Source language name.
+
+    Returns:
+        Keyword arguments for ``chat.completions.create``.
+    """
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional translator. Translate the following "
+                    "text to English. Provide ONLY the translation, no "
+                    "explanations or additional text."
+                ),
+            },
+            {
+                "role": "user",
+                "content": f"Translate this {source_language} text to English: {text}",
+            },
+        ],
+        "temperature": 0.3,
+        "max_tokens": 500,
+    }
+
+
+def _batch_translation_request(texts: list[str]) -> dict:
+    """Build the chat completion arguments for translating many texts at once.
+
+    Args:
+        texts: Texts to detect and translate, sent as one JSON array. At
+            most BATCH_TRANSLATION_SIZE texts fit the output token budget.
+
+    Returns:
+        Keyword arguments for ``chat.completions.create``.
+    """
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional translator. You receive a JSON array "
+                    "of texts. For each text, detect its language and translate it "
+                    'to English. Respond with a JSON object whose "translations" '
+                    "key holds an array of the same length and order, whose items "
+                    'are objects with the keys "language" (the language name, e.g. '
+                    '"Spanish") and "translation".'
+                ),
+            },
+            {
+                "role": "user",
+                "content": json.dumps(texts, ensure_ascii=False),
+            },
+        ],
+        "temperature": 0.3,
+        "max_tokens": min(BATCH_TOKENS_PER_TEXT * len(texts), MAX_BATCH_TOKENS),
+        "response_format": {"type": "json_object"},
+    }
+
 
 class TranslationService:
     """Handles language detection and translation using OpenAI API.
@@ -20,6 +247,7 @@ class TranslationService:
     Attributes:
         client: OpenAI client instance for API calls.
         _language_cache: Dictionary for caching language detection results.
+        _translation_cache: LRU-cached wrapper around the translation API call.
     """
 
     def __init__(self, api_key: Optional[str] = None):
@@ -31,12 +259,19 @@ class TranslationService:
         """
         self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
         self._language_cache = {}
+        # batch_translate() detects languages on several threads at once
+        self._language_lock = threading.Lock()
+        self._translation_cache = lru_cache(maxsize=CACHE_SIZE)(
+            self._call_translation_api
+        )
 
     def detect_language(self, text: str) -> str:
         """Detect the language of the input text.
 
-        Uses OpenAI's GPT-4o-mini model to identify the language of the provided
-        text. Returns "Unknown" for very short text or on API errors.
+        Plain ASCII English is recognised without any model. Otherwise uses the
+        local lingua model when it is installed and confident, and OpenAI's
+        GPT-4o-mini model as a last resort. Returns "Unknown" for very short
+        text or on API errors. Successful detections are cached per text.
 
         Args:
             text: Text to detect language for.
@@ -53,15 +288,37 @@ class TranslationService:
         if not text or len(text.strip()) < 3:
             return "Unknown"
 
+        cached = self._language_cache.get(text)
+        if cached is not None:
+            return cached
+
+        language = _detect_language_cheaply(text)
+        if language is not None:
+            self._cache_language(text, language)
+            return language
+
         try:
             response = self._call_language_detection_api(text)
             language = response.choices[0].message.content.strip()
+            self._cache_language(text, language)
             return language
 
         except Exception as e:
             print(f"Language detection error: {e}")
             return "Unknown"
 
+    def _cache_language(self, text: str, language: str):
+        """Remember a detected language, evicting the oldest entry when full.
+
+        Args:
+            text: Text the language was detected for.
+            language: Detected language name.
+        """
+        with self._language_lock:
+            if len(self._language_cache) >= CACHE_SIZE:
+                self._language_cache.pop(next(iter(self._language_cache)))
+            self._language_cache[text] = language
+
     def _call_language_detection_api(self, text: str):
         """Call OpenAI API for language detection.
 
@@ -74,26 +331,7 @@ class TranslationService:
         Raises:
             Exception: If API call fails.
         """
-        return self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a language detection expert. Respond with ONLY "
-                        "the language name (e.g., 'English', 'Spanish', 'French', "
-                        "'German', 'Italian', 'Chinese', 'Japanese', etc.). "
-                        "If you cannot determine the language, respond with 'Unknown'."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": f"What language is this text in? Text: {text[:200]}",
-                },
-            ],
-            temperature=0,
-            max_tokens=10,
-        )
+        return self.client.chat.completions.create(**_language_detection_request(text))
 
     def translate_to_english(
         self, text: str, source_language: Optional[str] = None
@@ -137,7 +375,7 @@ class TranslationService:
 
         # Perform translation
         try:
-            translated_text = self._call_translation_api(text, source_language)
+            translated_text = self._translation_cache(text, source_language)
             return self._create_translation_result(
                 text, translated_text, source_language, True
             )
@@ -197,39 +435,35 @@ class TranslationService:
             Exception: If API call fails.
         """
         response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a professional translator. Translate the following "
-                        "text to English. Provide ONLY the translation, no "
-                        "explanations or additional text."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": f"Translate this {source_language} text to English: {text}",
-                },
-            ],
-            temperature=0.3,
-            max_tokens=500,
+            **_translation_request(text, source_language)
         )
 
         return response.choices[0].message.content.strip()
 
-    def batch_translate(self, texts: list[str]) -> list[Dict[str, str]]:
+    def batch_translate(
+        self, texts: list[str], fallback: bool = True
+    ) -> list[Dict[str, str]]:
         """Translate multiple texts to English.
 
-        Processes a list of texts and translates each one individually.
-        Each result follows the same format as translate_to_english().
+        Texts already known to be English (or too short) are returned as is;
+        all other distinct texts are detected and translated with one API
+        request per BATCH_TRANSLATION_SIZE texts, falling back to one
+        translate_to_english() call per text of a chunk that fails. Up to
+        MAX_CONCURRENCY requests run at once on worker threads. Each result
+        follows the same format as translate_to_english().
 
         Args:
             texts: List of texts to translate.
+            fallback: Whether to translate text by text when the batch request
+                fails. Callers that run their own (e.g. concurrent) fallback
+                pass False to get the error instead.
 
         Returns:
             List of translation result dictionaries, one per input text.
 
+        Raises:
+            Exception: If the batch request fails and fallback is False.
+
         Examples:
             >>> service = TranslationService()
             >>> texts = ["Bonjour", "Hola", "Hello"]
@@ -237,7 +471,125 @@ class TranslationService:
             >>> len(results)
             3
         """
+        unique = list(dict.fromkeys(texts))
+        results = {}
+        pending = []
+        for text in unique:
+            language = self.known_language(text)
+            if language is not None and not self._should_translate(language):
+                results[text] = self._create_translation_result(
+                    text, text, language, False
+                )
+            else:
+                pending.append(text)
+
+        if not pending:
+            return [dict(results[text]) for text in texts]
+
+        # One request per chunk of what is left, then one per text for chunks
+        # that failed; each round runs its requests concurrently
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as pool:
+            if len(pending) > 1:
+                chunks = [
+                    pending[start:start + BATCH_TRANSLATION_SIZE]
+                    for start in range(0, len(pending), BATCH_TRANSLATION_SIZE)
+                ]
+                for chunk, outcome in zip(chunks, pool.map(self._translate_chunk, chunks)):
+                    if not isinstance(outcome, Exception):
+                        results.update(zip(chunk, outcome))
+                    elif not fallback:
+                        raise outcome
+                    else:
+                        print(f"Batch translation error: {outcome}")
+
+            rest = [text for text in pending if text not in results]
+            results.update(zip(rest, pool.map(self.translate_to_english, rest)))
+
+        return [dict(results[text]) for text in texts]
+
+    def _translate_chunk(self, texts: list[str]):
+        """Translate one chunk with a batch request, returning any error.
+
+        Args:
+            texts: Texts to translate.
+
+        Returns:
+            List of translation result dictionaries, or the exception raised
+            by the batch request.
+        """
+        try:
+            return self._call_batch_translation_api(texts)
+        except Exception as e:
+            return e
+
+    def known_language(self, text: str, load_detector: bool = True) -> Optional[str]:
+        """Get the language of a text if it is known without an API call.
+
+        Args:
+            text: Text to look up.
+            load_detector: Whether the local language model may be loaded
+                for this call. Pass False on an event loop so the lookup
+                never blocks; the model is then only used once loaded.
+
+        Returns:
+            "Unknown" for very short text, the cached or cheaply detected
+            language name, or None if the API would be needed.
+        """
+        if not text or len(text.strip()) < 3:
+            return "Unknown"
+        language = self._language_cache.get(text)
+        if language is None:
+            language = _detect_language_cheaply(text, load_detector)
+        return language
+
+    def _call_batch_translation_api(self, texts: list[str]) -> list[Dict[str, str]]:
+        """Detect and translate many texts with a single OpenAI API call.
+
+        Args:
+            texts: Texts to translate.
+
+        Returns:
+            List of translation result dictionaries, one per input text.
+
+        Raises:
+            ValueError: If the response does not hold a translations array
+                matching the input.
+            Exception: If API call fails.
+        """
+        response = self.client.chat.completions.create(
+            **_batch_translation_request(texts)
+        )
+        payload = json.loads(response.choices[0].message.content)
+        items = payload.get("translations") if isinstance(payload, dict) else None
+        if not isinstance(items, list) or len(items) != len(texts):
+            raise ValueError("batch response does not match the number of texts")
+
         results = []
-        for text in texts:
-            results.append(self.translate_to_english(text))
+        for text, item in zip(texts, items):
+            language = str(item["language"]).strip()
+            self._cache_language(text, language)
+            if self._should_translate(language):
+                results.append(
+                    self._create_translation_result(
+                        text, str(item["translation"]).strip(), language, True
+                    )
+                )
+            else:
+                results.append(
+                    self._create_translation_result(text, text, language, False)
+                )
         return results
+
+
+@lru_cache(maxsize=1)
+def get_translation_service() -> TranslationService:
+    """Return the process-wide TranslationService.
+
+    Sharing one instance reuses its OpenAI client connection pool and its
+    caches across sessions instead of rebuilding them per conversation.
+
+    Returns:
+        The shared TranslationService instance.
+    """
+    return TranslationService()
+
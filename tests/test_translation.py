@@ -5,67 +5,154 @@ without requiring voice input.
 """
 
 import asyncio
-from datetime import datetime
-import sys
+import json
 import os
+import sys
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import pytest
 
-from bot_main import TranscriptLogger
+if __name__ == "__main__":
+    # pytest puts src on the path (see pyproject.toml); a direct run must too
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from bot_main import TRANSLATED_SPEAKERS, TranscriptLogger
 
-async def test_translation():
-    """Test the translation feature with simulated conversation data.
 
-    Creates a simulated multilingual conversation and tests the translation
-    functionality, generating sample transcript files for review.
+# Simulate a multilingual conversation
+TEST_CONVERSATIONS: tuple[tuple[str, str, str], ...] = (
+    ("SYSTEM", "Hotel receptionist agent started", "English"),
+    ("USER", "Bonjour, je voudrais réserver une chambre", "French"),
+    (
+        "RECEPTIONIST",
+        "Bonjour! I'd be happy to help you with a reservation. When would you like to check in?",
+        "English",
+    ),
+    ("USER", "Je voudrais arriver le 15 décembre", "French"),
+    ("RECEPTIONIST", "Perfect! And when will you be checking out?", "English"),
+    ("USER", "El 20 de diciembre", "Spanish"),
+    (
+        "RECEPTIONIST",
+        "Great! So that's December 15th to December 20th. How many guests will be staying?",
+        "English",
+    ),
+    ("USER", "Dos personas", "Spanish"),
+    (
+        "RECEPTIONIST",
+        "Wonderful! Two guests for 5 nights. What type of room would you prefer?",
+        "English",
+    ),
+    ("USER", "Una habitación doble, por favor", "Spanish"),
+    ("SYSTEM", "Session ended", "English"),
+)
+
+
+async def save_transcripts(filename: str = "test_conversation.txt"):
+    """Log the simulated conversation and save every transcript format.
+
+    Args:
+        filename: Path of the main transcript file.
+
+    Returns:
+        Tuple of (original_file, bilingual_file, json_file). bilingual_file
+        is None if translation is unavailable.
     """
-    logger = TranscriptLogger(filename="test_conversation.txt", enable_translation=True)
-
-    # Simulate a multilingual conversation
-    test_conversations = [
-        ("SYSTEM", "Hotel receptionist agent started", "English"),
-        ("USER", "Bonjour, je voudrais réserver une chambre", "French"),
-        (
-            "RECEPTIONIST",
-            "Bonjour! I'd be happy to help you with a reservation. When would you like to check in?",
-            "English",
-        ),
-        ("USER", "Je voudrais arriver le 15 décembre", "French"),
-        ("RECEPTIONIST", "Perfect! And when will you be checking out?", "English"),
-        ("USER", "El 20 de diciembre", "Spanish"),
-        (
-            "RECEPTIONIST",
-            "Great! So that's December 15th to December 20th. How many guests will be staying?",
-            "English",
-        ),
-        ("USER", "Dos personas", "Spanish"),
-        (
-            "RECEPTIONIST",
-            "Wonderful! Two guests for 5 nights. What type of room would you prefer?",
-            "English",
-        ),
-        ("USER", "Una habitación doble, por favor", "Spanish"),
-        ("SYSTEM", "Session ended", "English"),
-    ]
+    # Translate from scratch rather than from the user's translation cache
+    logger = TranscriptLogger(filename=filename, enable_translation=True, cache_file=None)
+    logger.add_entries(TEST_CONVERSATIONS)
+
+    (original_file, bilingual_file), json_file = await asyncio.gather(
+        logger.save_full_transcript(), logger.save_json_transcript()
+    )
+    logger.close()
+    return original_file, bilingual_file, json_file
+
+
+def preview(bilingual_file) -> str:
+    """Build the expected languages and the start of the bilingual transcript.
 
-    for speaker, message, expected_lang in test_conversations:
-        logger.add_entry(speaker, message)
-        if speaker in ["USER", "RECEPTIONIST"]:
-            print(f"  (Expected language: {expected_lang})")
+    Args:
+        bilingual_file: Path to the bilingual transcript, or None.
 
-    original_file, bilingual_file = logger.save_full_transcript()
-    json_file = logger.save_json_transcript()
+    Returns:
+        Text to print for manual review.
+    """
+    # Collect output and write it once at the end instead of per line
+    out = []
+    for speaker, _, expected_lang in TEST_CONVERSATIONS:
+        if speaker in TRANSLATED_SPEAKERS:
+            out.append(f"  (Expected language: {expected_lang})")
+
+    # One stat call tells whether the file exists and whether it is truncated
+    try:
+        size = os.path.getsize(bilingual_file) if bilingual_file else 0
+    except OSError:
+        size = 0
 
-    if bilingual_file and os.path.exists(bilingual_file):
+    if size:
         with open(bilingual_file, "r", encoding="utf-8") as f:
-            content = f.read()
             # Show first 1500 characters
-            print(content[:1500])
-            if len(content) > 1500:
-                print("\n... (truncated)")
+            head = f.read(1500)
+        out.append(head)
+        if size > len(head.encode("utf-8")):
+            out.append("\n... (truncated)")
+
+    return "\n".join(out) + "\n"
+
+
+@pytest.fixture(scope="module")
+def transcripts(tmp_path_factory):
+    """Save the simulated conversation once for all tests in this module."""
+    filename = tmp_path_factory.mktemp("transcripts") / "test_conversation.txt"
+    return asyncio.run(save_transcripts(str(filename)))
+
+
+def test_translation(transcripts):
+    """Test the translation feature with simulated conversation data.
+
+    Prints the expected languages and the bilingual transcript for review.
+    """
+    _, bilingual_file, _ = transcripts
+    sys.stdout.write(preview(bilingual_file))
+
+
+def test_original_transcript(transcripts):
+    """The original transcript has one line per conversation entry."""
+    original_file, _, _ = transcripts
+    with open(original_file, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    assert len(lines) == len(TEST_CONVERSATIONS)
+    for line, (speaker, message, _) in zip(lines, TEST_CONVERSATIONS):
+        assert line.endswith(f"{speaker}: {message}")
+
+
+def test_json_transcript(transcripts):
+    """The JSON transcript holds every entry in order."""
+    _, _, json_file = transcripts
+    with open(json_file, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    assert [(e["speaker"], e["message"]) for e in entries] == [
+        (speaker, message) for speaker, message, _ in TEST_CONVERSATIONS
+    ]
+
+
+def test_english_entries_not_translated(transcripts):
+    """SYSTEM lines are never translated and English lines are left as is."""
+    _, bilingual_file, json_file = transcripts
+    with open(json_file, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    for entry, (speaker, _, expected_lang) in zip(entries, TEST_CONVERSATIONS):
+        if bilingual_file is None or speaker not in TRANSLATED_SPEAKERS:
+            # Translation is unavailable or never applies to this speaker
+            assert "translated" not in entry
+        else:
+            assert "needs_translation" in entry
+            if expected_lang == "English":
+                assert entry["needs_translation"] is False
 
 
 if __name__ == "__main__":
-    asyncio.run(test_translation())
+    _, bilingual_file, _ = asyncio.run(save_transcripts())
+    sys.stdout.write(preview(bilingual_file))